@@ -1,29 +1,192 @@
 import json
+import os
 import random
-import uuid
+import time
+from collections import namedtuple
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from itertools import accumulate, repeat
+from typing import Dict, List, Any, Optional, Tuple
 from faker import Faker
+import numpy as np
 import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 fake = Faker()
 
+LogEntry = namedtuple('LogEntry', 'timestamp log_line fields')
+
+# Bound once so hot paths skip the module attribute lookup on every draw
+_random = random.random
+_choice = random.choice
+_choices = random.choices
+_randint = random.randint
+_randrange = random.randrange
+_uniform = random.uniform
+_sample = random.sample
+
+# Sizes of the per-generator pools of pre-generated Faker values
+IP_POOL_SIZE = 10000
+USER_POOL_SIZE = 1000
+SENTENCE_POOL_SIZE = 1000
+FILE_NAME_POOL_SIZE = 1000
+POD_SUFFIX_POOL_SIZE = 10000
+
+# Random bytes fetched per os.urandom() call when minting ids
+UUID_BUF_SIZE = 16 * 1024
+
+# (network, prefix length) ranges Faker's ipv4() never returns: this-network,
+# shared, loopback, link-local, IETF/documentation/benchmark, multicast and reserved
+_EXCLUDED_IPV4_NETS = (
+    (0x00000000, 8), (0x64400000, 10), (0x7F000000, 8), (0xA9FE0000, 16),
+    (0xC0000000, 24), (0xC0000200, 24), (0xC0586300, 24), (0xC6120000, 15),
+    (0xC6336400, 24), (0xCB007100, 24), (0xE0000000, 3)
+)
+
+_MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# (epoch second, CLF, syslog, "%Y-%m-%d %H:%M:%S") for the last second formatted.
+# Swapped as a whole tuple so generator threads never see a torn entry.
+_second_cache = (None, None, None, None)
+
+# nginx Common Log Format line; a %-template so batches can format every
+# line through map(_CLF_TEMPLATE.__mod__, rows) without a Python frame per row
+_CLF_TEMPLATE = '%s - - [%s] "%s %s HTTP/1.1" %d %d "-" "%s" rt=%.3f correlation_id="%s"'
+
+# JSON encoder for the log lines: orjson when installed, stdlib json otherwise
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    _dumps = json.dumps
+
+# Quotes and escapes a str exactly as json.dumps does (C-accelerated)
+_json_str = json.encoder.encode_basestring_ascii
+
+def _second_stamps(now: float) -> Tuple[int, str, str, str]:
+    """Return the per-second timestamp strings for now, formatting them at most once a second"""
+    global _second_cache
+    sec = int(now)
+    cache = _second_cache
+    if cache[0] != sec:
+        tm = time.localtime(sec)
+        offset = tm.tm_gmtoff
+        sign = '+' if offset >= 0 else '-'
+        offset = abs(offset)
+        month = _MONTH_ABBR[tm.tm_mon - 1]
+        hms = f"{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}"
+        cache = _second_cache = (
+            sec,
+            f"{tm.tm_mday:02d}/{month}/{tm.tm_year}:{hms} {sign}{offset // 3600:02d}{offset % 3600 // 60:02d}",
+            f"{month} {tm.tm_mday:02d} {hms}",
+            f"{tm.tm_year}-{tm.tm_mon:02d}-{tm.tm_mday:02d} {hms}"
+        )
+    return cache
+
+def _cum_weights(weights: Dict[Any, float]) -> Tuple[List[Any], List[float]]:
+    """Split a weight mapping into the population and cum_weights used by random.choices"""
+    return list(weights.keys()), list(accumulate(weights.values()))
+
+def _never() -> bool:
+    return False
+
+def _np_distribution(weights: Dict[Any, float], dtype: Any = object) -> Tuple[np.ndarray, np.ndarray]:
+    """Freeze a weight mapping into (values, normalized probabilities) arrays for Generator.choice"""
+    probs = np.array(list(weights.values()), dtype=float)
+    return np.array(list(weights.keys()), dtype=dtype), probs / probs.sum()
+
+def _random_ipv4s(rng: np.random.Generator, n: int) -> List[str]:
+    """Format n random dotted-quad addresses, drawn in bulk and skipping the ranges Faker excludes"""
+    networks = np.array([net for net, _ in _EXCLUDED_IPV4_NETS], dtype=np.uint32)
+    masks = np.array([(0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF for _, bits in _EXCLUDED_IPV4_NETS], dtype=np.uint32)
+    
+    # Redraw until enough addresses fall outside every excluded range
+    addrs = np.empty(0, dtype=np.uint32)
+    while len(addrs) < n:
+        draw = rng.integers(0, 2**32, size=n, dtype=np.uint32)
+        allowed = ((draw[:, None] & masks) != networks).all(axis=1)
+        addrs = np.concatenate((addrs, draw[allowed]))
+    addrs = addrs[:n]
+    
+    octets = np.stack([(addrs >> shift) & 0xFF for shift in (24, 16, 8, 0)], axis=1)
+    return list(map('%d.%d.%d.%d'.__mod__, map(tuple, octets.tolist())))
+
 class LogGenerator:
+    __slots__ = (
+        'config', 'attack_state', 'business_state', '_rng', '_ip_pool', '_user_pool',
+        '_sentence_pool', '_file_name_pool', '_uuid_buf', '_uuid_pos'
+    )
+    
+    # (ip, user, sentence, file name pools), generated on first construction
+    # and shared by all instances
+    _SHARED_POOLS = None
+    
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.correlation_ids = {}
         self.attack_state = {}
         self.business_state = {}
-        
+        self._rng = np.random.default_rng()
+        
+        # Faker's provider dispatch is too slow for the per-log path, so draw
+        # from pools generated once up front
+        if LogGenerator._SHARED_POOLS is None:
+            LogGenerator._SHARED_POOLS = (
+                _random_ipv4s(self._rng, IP_POOL_SIZE),
+                [fake.user_name() for _ in range(USER_POOL_SIZE)],
+                [fake.sentence() for _ in range(SENTENCE_POOL_SIZE)],
+                [fake.file_name() for _ in range(FILE_NAME_POOL_SIZE)]
+            )
+        (self._ip_pool, self._user_pool,
+         self._sentence_pool, self._file_name_pool) = LogGenerator._SHARED_POOLS
+        
+        self._uuid_buf = b''
+        self._uuid_pos = 0
+        
+    def _rand_ip(self) -> str:
+        return self._ip_pool[_randrange(IP_POOL_SIZE)]
+    
+    def _rand_user(self) -> str:
+        return self._user_pool[_randrange(USER_POOL_SIZE)]
+    
+    def _rand_sentence(self) -> str:
+        return self._sentence_pool[_randrange(SENTENCE_POOL_SIZE)]
+    
+    def _rand_file_name(self) -> str:
+        return self._file_name_pool[_randrange(FILE_NAME_POOL_SIZE)]
+    
+    def _random_hex(self, nbytes: int) -> str:
+        # nbytes random bytes as hex, refilling from the OS in bulk
+        # rather than making a syscall per id
+        pos = self._uuid_pos
+        if pos + nbytes > len(self._uuid_buf):
+            self._uuid_buf = os.urandom(UUID_BUF_SIZE)
+            pos = 0
+        self._uuid_pos = pos + nbytes
+        return self._uuid_buf[pos:pos + nbytes].hex()
+    
+    def _fast_uuid(self) -> str:
+        # 128 random bits as 32 hex chars
+        return self._random_hex(16)
+    
+    def generate_batch(self, host_info: Dict[str, Any], n: int) -> List[LogEntry]:
+        """Generate n log entries for host_info in one call"""
+        return [self.generate_log(host_info) for _ in range(n)]
+    
     def generate_correlation_id(self, request_type: str = "user") -> str:
-        correlation_id = str(uuid.uuid4())
-        self.correlation_ids[correlation_id] = {
-            'created': datetime.now(),
-            'type': request_type
-        }
-        return correlation_id
+        # Ids are fire-and-forget; nothing reads them back, so they are not tracked
+        return self._fast_uuid()
 
 class NginxLogGenerator(LogGenerator):
+    __slots__ = (
+        'status_codes', 'user_agents', 'request_uris', '_status_pop', '_status_cw',
+        '_bf_enabled', '_bf_intensity', '_bf_ips', '_attack_uris', '_attack_statuses', '_is_attack_request',
+        '_status_arr', '_status_p', '_attack_status_arr', '_attack_ip_arr', '_attack_uri_arr',
+        '_request_uri_arr', '_post_uri_arr', '_method_arr', '_ip_pool_arr', '_user_agents_arr'
+    )
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.status_codes = {
@@ -37,44 +200,129 @@ class NginxLogGenerator(LogGenerator):
             "Go-http-client/1.1",
             "python-requests/2.28.0"
         ]
-        
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+        self.request_uris = [
+            "/", "/products", "/api/users", "/health", "/metrics",
+            "/api/orders", "/login", "/checkout", "/search"
+        ]
+        self._status_pop, self._status_cw = _cum_weights(self.status_codes)
+        
+        brute_force = config['security']['attack_patterns']['brute_force']
+        self._bf_enabled = brute_force['enabled']
+        self._bf_intensity = brute_force['intensity']
+        self._bf_ips = tuple(brute_force['source_ips'])
+        self._attack_uris = ("/admin/login", "/wp-admin", "/api/auth/login")
+        self._attack_statuses = (401, 403, 404)
+        # Per-instance check, bound to a constant False when brute force is off
+        self._is_attack_request = self._roll_attack_request if self._bf_enabled else _never
+        
+        # Arrays for the vectorized batch path
+        self._status_arr, self._status_p = _np_distribution(self.status_codes, np.int32)
+        self._attack_status_arr = np.array(self._attack_statuses)
+        self._attack_ip_arr = np.array(self._bf_ips, dtype=object)
+        self._attack_uri_arr = np.array(self._attack_uris, dtype=object)
+        self._request_uri_arr = np.array(self.request_uris, dtype=object)
+        self._post_uri_arr = np.array(["/login", "/api/auth/login", "/checkout"], dtype=object)
+        self._method_arr = np.array(["GET", "POST", "PUT"], dtype=object)
+        self._ip_pool_arr = np.array(self._ip_pool, dtype=object)
+        self._user_agents_arr = np.array(self.user_agents, dtype=object)
+        
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        now = time.time()
+        ts = datetime.fromtimestamp(now).isoformat()
         
         # Check for attack scenario
         is_attack = self._is_attack_request()
         
         if is_attack:
-            remote_addr = random.choice(self.config['security']['attack_patterns']['brute_force']['source_ips'])
-            status = random.choice([401, 403, 404])
-            request_uri = random.choice(["/admin/login", "/wp-admin", "/api/auth/login"])
+            remote_addr = _choice(self._bf_ips)
+            status = _choice(self._attack_statuses)
+            request_uri = _choice(self._attack_uris)
         else:
-            remote_addr = fake.ipv4()
-            status = self._weighted_choice(self.status_codes)
-            request_uri = random.choice([
-                "/", "/products", "/api/users", "/health", "/metrics",
-                "/api/orders", "/login", "/checkout", "/search"
-            ])
+            remote_addr = self._rand_ip()
+            status = _choices(self._status_pop, cum_weights=self._status_cw)[0]
+            request_uri = _choice(self.request_uris)
             
-        method = "POST" if request_uri in ["/login", "/api/auth/login", "/checkout"] else random.choice(["GET", "POST", "PUT"])
-        response_time = random.uniform(0.001, 2.5) if status == 200 else random.uniform(2.0, 10.0)
-        bytes_sent = random.randint(200, 50000) if status == 200 else random.randint(100, 1000)
+        method = "POST" if request_uri in ["/login", "/api/auth/login", "/checkout"] else _choice(["GET", "POST", "PUT"])
+        response_time = _uniform(0.001, 2.5) if status == 200 else _uniform(2.0, 10.0)
+        bytes_sent = _randint(200, 50000) if status == 200 else _randint(100, 1000)
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("http_request")
             
-        # Common Log Format
-        log_line = (
-            f'{remote_addr} - - [{timestamp.strftime("%d/%b/%Y:%H:%M:%S %z")}] '
-            f'"{method} {request_uri} HTTP/1.1" {status} {bytes_sent} '
-            f'"-" "{random.choice(self.user_agents)}" '
-            f'rt={response_time:.3f} correlation_id="{correlation_id}"'
+        return self._format_entry(
+            host_info, _second_stamps(now)[1], ts,
+            remote_addr, method, request_uri, status, response_time, bytes_sent,
+            _choice(self.user_agents), correlation_id
+        )
+    
+    def generate_batch(self, host_info: Dict[str, Any], n: int) -> List[LogEntry]:
+        rng = self._rng
+        now = time.time()
+        clf_time = _second_stamps(now)[1]
+        ts = datetime.fromtimestamp(now).isoformat()
+        
+        # Draw every field for the whole batch in one call each, so the
+        # formatting loop below never calls into random or Faker
+        statuses = rng.choice(self._status_arr, size=n, p=self._status_p)
+        remote_addrs = rng.choice(self._ip_pool_arr, size=n)
+        request_uris = rng.choice(self._request_uri_arr, size=n)
+        if self._bf_enabled:
+            # Only touch the attack arrays when brute force is on; they may be empty otherwise
+            attacks = rng.random(n) < self._bf_intensity
+            statuses = np.where(attacks, rng.choice(self._attack_status_arr, size=n), statuses)
+            remote_addrs = np.where(attacks, rng.choice(self._attack_ip_arr, size=n), remote_addrs)
+            request_uris = np.where(attacks, rng.choice(self._attack_uri_arr, size=n), request_uris)
+        ok = statuses == 200
+        response_times = np.where(ok, rng.uniform(0.001, 2.5, size=n), rng.uniform(2.0, 10.0, size=n))
+        bytes_sent = np.where(ok, rng.integers(200, 50001, size=n), rng.integers(100, 1001, size=n))
+        user_agents = rng.choice(self._user_agents_arr, size=n)
+        methods = np.where(
+            np.isin(request_uris, self._post_uri_arr),
+            "POST",
+            rng.choice(self._method_arr, size=n)
         )
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': log_line,
-            'fields': {
+        remote_addrs = remote_addrs.tolist()
+        methods = methods.tolist()
+        request_uris = request_uris.tolist()
+        statuses = statuses.tolist()
+        response_times = response_times.tolist()
+        bytes_sent = bytes_sent.tolist()
+        correlation_ids = [self.generate_correlation_id("http_request") for _ in range(n)]
+        
+        log_lines = list(map(_CLF_TEMPLATE.__mod__, zip(
+            remote_addrs, repeat(clf_time, n), methods, request_uris, statuses,
+            bytes_sent, user_agents.tolist(), response_times, correlation_ids
+        )))
+        host = host_info['name']
+        return [
+            LogEntry(ts, log_line, {
+                'remote_addr': remote_addr,
+                'method': method,
+                'request_uri': request_uri,
+                'status': status,
+                'response_time': response_time,
+                'bytes_sent': sent,
+                'correlation_id': correlation_id,
+                'host': host
+            })
+            for log_line, remote_addr, method, request_uri, status, response_time, sent, correlation_id in zip(
+                log_lines, remote_addrs, methods, request_uris, statuses,
+                response_times, bytes_sent, correlation_ids
+            )
+        ]
+    
+    def _format_entry(self, host_info: Dict[str, Any], clf_time: str, iso_time: str,
+                      remote_addr: str, method: str, request_uri: str, status: int,
+                      response_time: float, bytes_sent: int, user_agent: str,
+                      correlation_id: str) -> LogEntry:
+        return LogEntry(
+            timestamp=iso_time,
+            log_line=_CLF_TEMPLATE % (
+                remote_addr, clf_time, method, request_uri, status,
+                bytes_sent, user_agent, response_time, correlation_id
+            ),
+            fields={
                 'remote_addr': remote_addr,
                 'method': method,
                 'request_uri': request_uri,
@@ -84,44 +332,50 @@ class NginxLogGenerator(LogGenerator):
                 'correlation_id': correlation_id,
                 'host': host_info['name']
             }
-        }
+        )
+    
+    def _roll_attack_request(self) -> bool:
+        return _random() < self._bf_intensity
     
-    def _is_attack_request(self) -> bool:
-        if not self.config['security']['attack_patterns']['brute_force']['enabled']:
-            return False
-        return random.random() < self.config['security']['attack_patterns']['brute_force']['intensity']
-    
-    def _weighted_choice(self, choices: Dict[int, float]) -> int:
-        total = sum(choices.values())
-        r = random.uniform(0, total)
-        upto = 0
-        for choice, weight in choices.items():
-            if upto + weight >= r:
-                return choice
-            upto += weight
-        return list(choices.keys())[0]
 
 class JavaAppLogGenerator(LogGenerator):
+    __slots__ = ('log_levels', 'loggers', '_logger_category', '_level_pop', '_level_cw', '_level_arr', '_level_p')
+    
+    _HTTP_METHODS = ('GET', 'POST', 'PUT')
+    _RESOURCES = ('users', 'orders', 'payments')
+    _PROCESSED = ('payment', 'order', 'user registration')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.log_levels = {
             'INFO': 0.60, 'WARN': 0.20, 'ERROR': 0.10, 
             'DEBUG': 0.08, 'TRACE': 0.02
         }
-        self.loggers = [
-            'com.example.controller.UserController',
-            'com.example.service.PaymentService',
-            'com.example.repository.OrderRepository',
-            'com.example.security.AuthenticationFilter',
-            'org.springframework.web.servlet.DispatcherServlet',
-            'org.hibernate.SQL'
-        ]
+        # Logger name -> message category used by _generate_message
+        self._logger_category = {
+            'com.example.controller.UserController': 'controller',
+            'com.example.service.PaymentService': 'service',
+            'com.example.repository.OrderRepository': 'repository',
+            'com.example.security.AuthenticationFilter': 'security',
+            'org.springframework.web.servlet.DispatcherServlet': 'other',
+            'org.hibernate.SQL': 'other'
+        }
+        self.loggers = list(self._logger_category)
+        self._level_pop, self._level_cw = _cum_weights(self.log_levels)
+        self._level_arr, self._level_p = _np_distribution(self.log_levels)
         
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
-        level = self._weighted_choice(self.log_levels)
-        logger = random.choice(self.loggers)
-        thread = f"http-nio-8080-exec-{random.randint(1, 20)}"
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        level = _choices(self._level_pop, cum_weights=self._level_cw)[0]
+        return self._build_entry(host_info, correlation_id, level)
+    
+    def generate_batch(self, host_info: Dict[str, Any], n: int) -> List[LogEntry]:
+        levels = self._rng.choice(self._level_arr, size=n, p=self._level_p)
+        return [self._build_entry(host_info, None, level) for level in levels.tolist()]
+    
+    def _build_entry(self, host_info: Dict[str, Any], correlation_id: Optional[str], level: str) -> LogEntry:
+        ts = datetime.now().isoformat()
+        logger = _choice(self.loggers)
+        thread = f"http-nio-8080-exec-{_randint(1, 20)}"
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("app_request")
@@ -129,7 +383,7 @@ class JavaAppLogGenerator(LogGenerator):
         message = self._generate_message(level, logger)
         
         log_entry = {
-            "timestamp": timestamp.isoformat(),
+            "timestamp": ts,
             "level": level,
             "logger": logger,
             "thread": thread,
@@ -151,56 +405,85 @@ class JavaAppLogGenerator(LogGenerator):
             exception_text = f" exception_class=\"java.sql.SQLException\" exception_message=\"Connection timeout after 30000ms\" stack_trace=\"java.sql.SQLException: Connection timeout\\n\\tat com.example.repository.OrderRepository.findById(OrderRepository.java:45)\""
         
         # Raw structured text format requiring field extraction
-        raw_log_line = f"{timestamp.isoformat()} [{level:5}] [{thread}] {logger} - {message} correlation_id=\"{correlation_id}\" host=\"{host_info['name']}\" service=\"user-service\" version=\"1.2.3\"{exception_text}"
+        raw_log_line = f"{ts} [{level:5}] [{thread}] {logger} - {message} correlation_id=\"{correlation_id}\" host=\"{host_info['name']}\" service=\"user-service\" version=\"1.2.3\"{exception_text}"
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': raw_log_line,
-            'fields': log_entry
-        }
+        return LogEntry(
+            timestamp=ts,
+            log_line=raw_log_line,
+            fields=log_entry
+        )
     
     def _generate_message(self, level: str, logger: str) -> str:
-        if "Controller" in logger:
-            return f"Processing {random.choice(['GET', 'POST', 'PUT'])} request to /api/{random.choice(['users', 'orders', 'payments'])}"
-        elif "Service" in logger:
+        category = self._logger_category[logger]
+        if category == "controller":
+            return f"Processing {_choice(self._HTTP_METHODS)} request to /api/{_choice(self._RESOURCES)}"
+        elif category == "service":
             if level == "ERROR":
-                return f"Failed to process payment for order {fake.uuid4()}: Gateway timeout"
-            return f"Successfully processed {random.choice(['payment', 'order', 'user registration'])} for user {fake.uuid4()}"
-        elif "Repository" in logger:
-            return f"Executing query: SELECT * FROM {random.choice(['users', 'orders', 'payments'])} WHERE id = ?"
-        elif "Security" in logger:
-            return f"User authentication {'successful' if level != 'ERROR' else 'failed'} for user: {fake.user_name()}"
+                return f"Failed to process payment for order {self._fast_uuid()}: Gateway timeout"
+            return f"Successfully processed {_choice(self._PROCESSED)} for user {self._fast_uuid()}"
+        elif category == "repository":
+            return f"Executing query: SELECT * FROM {_choice(self._RESOURCES)} WHERE id = ?"
+        elif category == "security":
+            return f"User authentication {'successful' if level != 'ERROR' else 'failed'} for user: {self._rand_user()}"
         else:
-            return f"Application event: {fake.sentence()}"
-    
-    def _weighted_choice(self, choices: Dict[str, float]) -> str:
-        total = sum(choices.values())
-        r = random.uniform(0, total)
-        upto = 0
-        for choice, weight in choices.items():
-            if upto + weight >= r:
-                return choice
-            upto += weight
-        return list(choices.keys())[0]
+            return f"Application event: {self._rand_sentence()}"
+    
 
 class KubernetesLogGenerator(LogGenerator):
+    __slots__ = ('namespaces', 'log_levels', '_level_pop', '_level_cw', '_level_arr', '_level_p', '_pod_suffix_pool')
+    
+    _POD_PREFIXES = ("nginx", "api-server", "worker", "redis")
+    _CONTAINERS = ("main", "sidecar", "init")
+    _ERROR_MSGS = (
+        "Pod failed to start: ImagePullBackOff",
+        "Container crashed with exit code 1",
+        "Failed to mount volume: permission denied",
+        "Readiness probe failed: HTTP probe failed with statuscode: 503"
+    )
+    _WARN_MSGS = (
+        "Pod memory usage above 80%",
+        "Container restart count increased",
+        "Slow startup detected: 45s to ready",
+        "Deprecated API version detected"
+    )
+    _INFO_MSGS = (
+        "Pod successfully scheduled on node",
+        "Container started successfully",
+        "Health check passed",
+        "Resource limits updated"
+    )
+    _MSGS_BY_LEVEL = {"ERROR": _ERROR_MSGS, "WARN": _WARN_MSGS, "INFO": _INFO_MSGS}
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.namespaces = ["default", "kube-system", "monitoring", "app-prod", "app-staging"]
         self.log_levels = {"INFO": 0.70, "WARN": 0.20, "ERROR": 0.10}
+        self._level_pop, self._level_cw = _cum_weights(self.log_levels)
+        self._level_arr, self._level_p = _np_distribution(self.log_levels)
+        self._pod_suffix_pool = [
+            ''.join(_choices('abcdefghijklmnopqrstuvwxyz', k=5)) for _ in range(POD_SUFFIX_POOL_SIZE)
+        ]
         
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
-        namespace = random.choice(self.namespaces)
-        pod_name = f"{random.choice(['nginx', 'api-server', 'worker', 'redis'])}-{fake.random_int(1000, 9999)}-{''.join(random.choices('abcdefghijklmnopqrstuvwxyz', k=5))}"
-        container = random.choice(["main", "sidecar", "init"])
-        level = self._weighted_choice(self.log_levels)
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        level = _choices(self._level_pop, cum_weights=self._level_cw)[0]
+        return self._build_entry(host_info, correlation_id, level)
+    
+    def generate_batch(self, host_info: Dict[str, Any], n: int) -> List[LogEntry]:
+        levels = self._rng.choice(self._level_arr, size=n, p=self._level_p)
+        return [self._build_entry(host_info, None, level) for level in levels.tolist()]
+    
+    def _build_entry(self, host_info: Dict[str, Any], correlation_id: Optional[str], level: str) -> LogEntry:
+        ts = datetime.now().isoformat()
+        namespace = _choice(self.namespaces)
+        suffix = self._pod_suffix_pool[_randrange(POD_SUFFIX_POOL_SIZE)]
+        pod_name = f"{_choice(self._POD_PREFIXES)}-{1000 + int(_random() * 9000)}-{suffix}"
+        container = _choice(self._CONTAINERS)
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("k8s_event")
             
         log_entry = {
-            "timestamp": timestamp.isoformat(),
+            "timestamp": ts,
             "namespace": namespace,
             "pod": pod_name,
             "container": container,
@@ -211,88 +494,88 @@ class KubernetesLogGenerator(LogGenerator):
             "cluster": "production-cluster"
         }
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': json.dumps(log_entry),
-            'fields': log_entry
-        }
+        # Fixed schema, so emit the same text json.dumps would without its
+        # encoder machinery; only free-form values need escaping
+        log_line = (
+            f'{{"timestamp": "{ts}", "namespace": "{namespace}", '
+            f'"pod": "{pod_name}", "container": "{container}", "level": "{level}", '
+            f'"message": {_json_str(log_entry["message"])}, '
+            f'"correlation_id": {_json_str(correlation_id)}, '
+            f'"node": {_json_str(host_info["name"])}, "cluster": "production-cluster"}}'
+        )
+        
+        return LogEntry(
+            timestamp=ts,
+            log_line=log_line,
+            fields=log_entry
+        )
     
     def _generate_k8s_message(self, level: str, namespace: str) -> str:
-        if level == "ERROR":
-            return random.choice([
-                "Pod failed to start: ImagePullBackOff",
-                "Container crashed with exit code 1",
-                "Failed to mount volume: permission denied",
-                "Readiness probe failed: HTTP probe failed with statuscode: 503"
-            ])
-        elif level == "WARN":
-            return random.choice([
-                "Pod memory usage above 80%",
-                "Container restart count increased",
-                "Slow startup detected: 45s to ready",
-                "Deprecated API version detected"
-            ])
-        else:
-            return random.choice([
-                f"Pod successfully scheduled on node",
-                f"Container started successfully",
-                f"Health check passed",
-                f"Resource limits updated"
-            ])
-    
-    def _weighted_choice(self, choices: Dict[str, float]) -> str:
-        total = sum(choices.values())
-        r = random.uniform(0, total)
-        upto = 0
-        for choice, weight in choices.items():
-            if upto + weight >= r:
-                return choice
-            upto += weight
-        return list(choices.keys())[0]
+        return _choice(self._MSGS_BY_LEVEL[level])
+    
 
 class SystemAccessLogGenerator(LogGenerator):
+    __slots__ = (
+        'users', 'actions', '_action_pop', '_action_cw',
+        '_bf_enabled', '_bf_intensity', '_bf_ips', '_attack_users', '_is_attack_attempt'
+    )
+    
+    _SHARED_USERS = None
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
-        self.users = ["admin", "deploy", "monitoring", "backup"] + [fake.user_name() for _ in range(10)]
+        if SystemAccessLogGenerator._SHARED_USERS is None:
+            SystemAccessLogGenerator._SHARED_USERS = ["admin", "deploy", "monitoring", "backup"] + _sample(self._user_pool, 10)
+        self.users = SystemAccessLogGenerator._SHARED_USERS
         self.actions = {
             "login": 0.40, "logout": 0.35, "sudo": 0.15, 
             "ssh_key_auth": 0.05, "password_change": 0.05
         }
+        self._action_pop, self._action_cw = _cum_weights(self.actions)
+        
+        brute_force = config['security']['attack_patterns']['brute_force']
+        self._bf_enabled = brute_force['enabled']
+        self._bf_intensity = brute_force['intensity']
+        self._bf_ips = tuple(brute_force['source_ips'])
+        self._attack_users = ("admin", "root", "administrator")
+        # Per-instance check, bound to a constant False when brute force is off
+        self._is_attack_attempt = self._roll_attack_attempt if self._bf_enabled else _never
         
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        now = time.time()
+        ts = datetime.fromtimestamp(now).isoformat()
         
         # Check for attack scenario
         is_attack = self._is_attack_attempt()
         
         if is_attack:
-            user = random.choice(["admin", "root", "administrator"])
-            source_ip = random.choice(self.config['security']['attack_patterns']['brute_force']['source_ips'])
+            user = _choice(self._attack_users)
+            source_ip = _choice(self._bf_ips)
             action = "login"
             result = "FAILED"
             session_id = "none"
         else:
-            user = random.choice(self.users)
-            source_ip = fake.ipv4()
-            action = self._weighted_choice(self.actions)
-            result = "SUCCESS" if random.random() > 0.05 else "FAILED"
-            session_id = fake.uuid4() if result == "SUCCESS" else "none"
+            user = _choice(self.users)
+            source_ip = self._rand_ip()
+            action = _choices(self._action_pop, cum_weights=self._action_cw)[0]
+            result = "SUCCESS" if _random() > 0.05 else "FAILED"
+            session_id = self._fast_uuid() if result == "SUCCESS" else "none"
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("access_event")
             
         # Syslog format
         log_line = (
-            f'{timestamp.strftime("%b %d %H:%M:%S")} {host_info["name"]} '
-            f'sshd[{random.randint(1000, 9999)}]: {result} {action} for user {user} '
-            f'from {source_ip} port {random.randint(30000, 65000)} '
+            f'{_second_stamps(now)[2]} {host_info["name"]} '
+            f'sshd[{1000 + int(_random() * 9000)}]: {result} {action} for user {user} '
+            f'from {source_ip} port {30000 + int(_random() * 35001)} '
             f'session_id="{session_id}" correlation_id="{correlation_id}"'
         )
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': log_line,
-            'fields': {
+        return LogEntry(
+            timestamp=ts,
+            log_line=log_line,
+            fields={
                 'user': user,
                 'source_ip': source_ip,
                 'action': action,
@@ -301,54 +584,55 @@ class SystemAccessLogGenerator(LogGenerator):
                 'correlation_id': correlation_id,
                 'host': host_info['name']
             }
-        }
+        )
+    
+    def _roll_attack_attempt(self) -> bool:
+        return _random() < self._bf_intensity
     
-    def _is_attack_attempt(self) -> bool:
-        if not self.config['security']['attack_patterns']['brute_force']['enabled']:
-            return False
-        return random.random() < self.config['security']['attack_patterns']['brute_force']['intensity']
-    
-    def _weighted_choice(self, choices: Dict[str, float]) -> str:
-        total = sum(choices.values())
-        r = random.uniform(0, total)
-        upto = 0
-        for choice, weight in choices.items():
-            if upto + weight >= r:
-                return choice
-            upto += weight
-        return list(choices.keys())[0]
 
 class EcommerceLogGenerator(LogGenerator):
+    __slots__ = ('payment_methods', 'status_weights', '_status_pop', '_status_cw', '_status_arr', '_status_p')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.payment_methods = ["credit_card", "paypal", "apple_pay", "google_pay", "bank_transfer"]
         self.status_weights = {"completed": 0.85, "failed": 0.10, "pending": 0.03, "cancelled": 0.02}
+        self._status_pop, self._status_cw = _cum_weights(self.status_weights)
+        self._status_arr, self._status_p = _np_distribution(self.status_weights)
         
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        status = _choices(self._status_pop, cum_weights=self._status_cw)[0]
+        return self._build_entry(host_info, correlation_id, status)
+    
+    def generate_batch(self, host_info: Dict[str, Any], n: int) -> List[LogEntry]:
+        statuses = self._rng.choice(self._status_arr, size=n, p=self._status_p)
+        return [self._build_entry(host_info, None, status) for status in statuses.tolist()]
+    
+    def _build_entry(self, host_info: Dict[str, Any], correlation_id: Optional[str], status: str) -> LogEntry:
+        # status is the drawn transaction outcome, overridden during a gateway outage
+        ts = datetime.now().isoformat()
         
         # Check for payment gateway outage
-        is_outage = random.random() < self.config['business']['failure_scenarios']['payment_gateway_outage']['probability']
+        is_outage = _random() < self.config['business']['failure_scenarios']['payment_gateway_outage']['probability']
         
-        order_id = fake.uuid4()
-        customer_id = fake.uuid4()
-        payment_method = random.choice(self.payment_methods)
-        amount = round(random.uniform(10.99, 999.99), 2)
+        order_id = self._fast_uuid()
+        customer_id = self._fast_uuid()
+        payment_method = _choice(self.payment_methods)
+        amount = round(_uniform(10.99, 999.99), 2)
         
         if is_outage:
             status = "failed"
             error_code = "GATEWAY_TIMEOUT"
-            processing_time = random.uniform(30.0, 60.0)
+            processing_time = _uniform(30.0, 60.0)
         else:
-            status = self._weighted_choice(self.status_weights)
-            error_code = None if status == "completed" else random.choice(["INSUFFICIENT_FUNDS", "CARD_DECLINED", "FRAUD_DETECTED"])
-            processing_time = random.uniform(0.5, 5.0)
+            error_code = None if status == "completed" else _choice(["INSUFFICIENT_FUNDS", "CARD_DECLINED", "FRAUD_DETECTED"])
+            processing_time = _uniform(0.5, 5.0)
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("transaction")
             
         log_entry = {
-            "timestamp": timestamp.isoformat(),
+            "timestamp": ts,
             "event_type": "transaction",
             "order_id": order_id,
             "customer_id": customer_id,
@@ -364,23 +648,16 @@ class EcommerceLogGenerator(LogGenerator):
         if error_code:
             log_entry["error_code"] = error_code
             
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': json.dumps(log_entry),
-            'fields': log_entry
-        }
+        return LogEntry(
+            timestamp=ts,
+            log_line=_dumps(log_entry),
+            fields=log_entry
+        )
     
-    def _weighted_choice(self, choices: Dict[str, float]) -> str:
-        total = sum(choices.values())
-        r = random.uniform(0, total)
-        upto = 0
-        for choice, weight in choices.items():
-            if upto + weight >= r:
-                return choice
-            upto += weight
-        return list(choices.keys())[0]
 
 class APIGatewayLogGenerator(LogGenerator):
+    __slots__ = ('endpoints', 'client_types', 'response_codes', '_resp_pop', '_resp_cw')
+    
     def __init__(self, config: Dict[str, Any]):
         super().__init__(config)
         self.endpoints = [
@@ -389,38 +666,40 @@ class APIGatewayLogGenerator(LogGenerator):
             "/api/v2/analytics", "/api/v1/health"
         ]
         self.client_types = ["mobile_app", "web_app", "partner_api", "internal_service"]
+        self.response_codes = {200: 70, 201: 10, 400: 8, 401: 5, 404: 4, 500: 3}
+        self._resp_pop, self._resp_cw = _cum_weights(self.response_codes)
         
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        ts = datetime.now().isoformat()
         
         # Check for API abuse
-        is_abuse = random.random() < self.config['security']['attack_patterns']['api_abuse']['intensity']
+        is_abuse = _random() < self.config['security']['attack_patterns']['api_abuse']['intensity']
         
         if is_abuse:
-            endpoint = random.choice(self.config['security']['attack_patterns']['api_abuse']['target_endpoints'])
-            api_key = "suspicious_key_" + fake.uuid4()[:8]
+            endpoint = _choice(self.config['security']['attack_patterns']['api_abuse']['target_endpoints'])
+            api_key = "suspicious_key_" + self._fast_uuid()[:8]
             rate_limit_exceeded = True
             response_code = 429
         else:
-            endpoint = random.choice(self.endpoints)
-            api_key = fake.uuid4()
+            endpoint = _choice(self.endpoints)
+            api_key = self._fast_uuid()
             rate_limit_exceeded = False
-            response_code = random.choices([200, 201, 400, 401, 404, 500], weights=[70, 10, 8, 5, 4, 3])[0]
+            response_code = _choices(self._resp_pop, cum_weights=self._resp_cw)[0]
             
-        client_id = fake.uuid4()
-        response_time = random.uniform(10, 500)  # milliseconds
-        quota_remaining = random.randint(0, 1000) if not rate_limit_exceeded else 0
+        client_id = self._fast_uuid()
+        response_time = _uniform(10, 500)  # milliseconds
+        quota_remaining = _randint(0, 1000) if not rate_limit_exceeded else 0
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("api_request")
             
         log_entry = {
-            "timestamp": timestamp.isoformat(),
+            "timestamp": ts,
             "endpoint": endpoint,
-            "method": random.choice(["GET", "POST", "PUT", "DELETE"]),
+            "method": _choice(["GET", "POST", "PUT", "DELETE"]),
             "api_key": api_key,
             "client_id": client_id,
-            "client_type": random.choice(self.client_types),
+            "client_type": _choice(self.client_types),
             "response_code": response_code,
             "response_time": round(response_time, 2),
             "rate_limit_exceeded": rate_limit_exceeded,
@@ -429,133 +708,159 @@ class APIGatewayLogGenerator(LogGenerator):
             "host": host_info['name']
         }
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': json.dumps(log_entry),
-            'fields': log_entry
-        }
+        return LogEntry(
+            timestamp=ts,
+            log_line=_dumps(log_entry),
+            fields=log_entry
+        )
 
 # Additional generators would follow similar patterns...
 # For brevity, I'll create placeholder classes for the remaining log types
 
 class DatabaseLogGenerator(LogGenerator):
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    __slots__ = ()
+    
+    _QUERY_TYPES = ("SELECT", "INSERT", "UPDATE", "DELETE")
+    _TABLES = ("users", "orders", "products", "payments", "sessions")
+    
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        now = time.time()
+        ts = datetime.fromtimestamp(now).isoformat()
         
         # Check for database slowdown scenario
-        is_slow = random.random() < self.config['business']['failure_scenarios']['database_slowdown']['probability']
+        is_slow = _random() < self.config['business']['failure_scenarios']['database_slowdown']['probability']
         slowdown_factor = self.config['business']['failure_scenarios']['database_slowdown']['slowdown_factor'] if is_slow else 1
         
-        query_types = ["SELECT", "INSERT", "UPDATE", "DELETE"]
-        tables = ["users", "orders", "products", "payments", "sessions"]
-        
-        query_type = random.choice(query_types)
-        table = random.choice(tables)
-        duration = random.uniform(0.001, 1.0) * slowdown_factor
+        query_type = _choice(self._QUERY_TYPES)
+        table = _choice(self._TABLES)
+        duration = _uniform(0.001, 1.0) * slowdown_factor
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("db_query")
         
         # PostgreSQL log format
         log_line = (
-            f'{timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]} UTC '
-            f'[{random.randint(1000, 9999)}] LOG: duration: {duration*1000:.3f} ms '
+            f'{_second_stamps(now)[3]}.{int(now % 1 * 1000):03d} UTC '
+            f'[{1000 + int(_random() * 9000)}] LOG: duration: {duration*1000:.3f} ms '
             f'statement: {query_type} * FROM {table} WHERE id = $1 '
             f'correlation_id="{correlation_id}"'
         )
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': log_line,
-            'fields': {
+        return LogEntry(
+            timestamp=ts,
+            log_line=log_line,
+            fields={
                 'query_type': query_type,
                 'table_name': table,
                 'duration': round(duration, 6),
                 'correlation_id': correlation_id,
                 'host': host_info['name']
             }
-        }
+        )
 
 class DockerLogGenerator(LogGenerator):
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    __slots__ = ()
+    
+    _CONTAINER_EVENTS = ("start", "stop", "restart", "oom_kill", "health_check")
+    _EXIT_EVENTS = frozenset(("stop", "oom_kill"))
+    _EXIT_CODES = (0, 1, 125, 137)
+    _IMAGES = ("nginx", "postgres", "redis", "app")
+    
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        ts = datetime.now().isoformat()
         
-        container_events = ["start", "stop", "restart", "oom_kill", "health_check"]
-        event = random.choice(container_events)
+        event = _choice(self._CONTAINER_EVENTS)
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("container_event")
             
         log_entry = {
-            "timestamp": timestamp.isoformat(),
-            "container_id": fake.uuid4()[:12],
-            "image": f"{random.choice(['nginx', 'postgres', 'redis', 'app'])}:{fake.random_int(1, 5)}.{fake.random_int(0, 9)}",
+            "timestamp": ts,
+            "container_id": self._fast_uuid()[:12],
+            "image": f"{_choice(self._IMAGES)}:{1 + int(_random() * 5)}.{int(_random() * 10)}",
             "event": event,
-            "exit_code": random.choice([0, 1, 125, 137]) if event in ["stop", "oom_kill"] else None,
+            "exit_code": _choice(self._EXIT_CODES) if event in self._EXIT_EVENTS else None,
             "correlation_id": correlation_id,
             "host": host_info['name']
         }
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': json.dumps(log_entry),
-            'fields': log_entry
-        }
+        return LogEntry(
+            timestamp=ts,
+            log_line=_dumps(log_entry),
+            fields=log_entry
+        )
 
 class CDNLogGenerator(LogGenerator):
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    __slots__ = ('cache_statuses', '_cache_pop', '_cache_cw')
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.cache_statuses = {"HIT": 70, "MISS": 25, "STALE": 5}
+        self._cache_pop, self._cache_cw = _cum_weights(self.cache_statuses)
+        
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        now = time.time()
+        ts = datetime.fromtimestamp(now).isoformat()
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("cdn_request")
             
-        cache_status = random.choices(["HIT", "MISS", "STALE"], weights=[70, 25, 5])[0]
-        edge_location = random.choice(["us-west-1", "us-east-1", "eu-west-1", "ap-southeast-1"])
+        cache_status = _choices(self._cache_pop, cum_weights=self._cache_cw)[0]
+        edge_location = _choice(["us-west-1", "us-east-1", "eu-west-1", "ap-southeast-1"])
         
         log_line = (
-            f'{timestamp.strftime("%Y-%m-%d %H:%M:%S")} {edge_location} '
-            f'{fake.ipv4()} {random.choice(["GET", "POST"])} '
-            f'/static/{fake.file_name()} {random.choice([200, 304, 404, 502])} '
-            f'{cache_status} {random.randint(100, 50000)} '
+            f'{_second_stamps(now)[3]} {edge_location} '
+            f'{self._rand_ip()} {_choice(["GET", "POST"])} '
+            f'/static/{self._rand_file_name()} {_choice([200, 304, 404, 502])} '
+            f'{cache_status} {_randint(100, 50000)} '
             f'correlation_id="{correlation_id}"'
         )
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': log_line,
-            'fields': {
+        return LogEntry(
+            timestamp=ts,
+            log_line=log_line,
+            fields={
                 'edge_location': edge_location,
                 'cache_status': cache_status,
                 'correlation_id': correlation_id,
                 'host': host_info['name']
             }
-        }
+        )
 
 class CICDLogGenerator(LogGenerator):
-    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> Dict[str, str]:
-        timestamp = datetime.now()
+    __slots__ = ('build_statuses', '_build_pop', '_build_cw')
+    
+    _STAGES = ("build", "test", "security_scan", "deploy")
+    _BRANCHES = ("main", "develop", "feature/auth", "hotfix/payment")
+    
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.build_statuses = {"success": 85, "failure": 15}
+        self._build_pop, self._build_cw = _cum_weights(self.build_statuses)
+        
+    def generate_log(self, host_info: Dict[str, Any], correlation_id: str = None) -> LogEntry:
+        ts = datetime.now().isoformat()
         
         if correlation_id is None:
             correlation_id = self.generate_correlation_id("build_event")
             
-        stages = ["build", "test", "security_scan", "deploy"]
-        stage = random.choice(stages)
-        status = random.choices(["success", "failure"], weights=[85, 15])[0]
+        stage = _choice(self._STAGES)
+        status = _choices(self._build_pop, cum_weights=self._build_cw)[0]
         
         log_entry = {
-            "timestamp": timestamp.isoformat(),
-            "build_id": fake.uuid4(),
+            "timestamp": ts,
+            "build_id": self._fast_uuid(),
             "stage": stage,
             "status": status,
-            "duration": random.randint(30, 600),
-            "commit_hash": fake.sha1(),
-            "branch": random.choice(["main", "develop", "feature/auth", "hotfix/payment"]),
+            "duration": _randint(30, 600),
+            "commit_hash": self._random_hex(20),  # sha1-sized
+            "branch": _choice(self._BRANCHES),
             "correlation_id": correlation_id,
             "host": host_info['name']
         }
         
-        return {
-            'timestamp': timestamp.isoformat(),
-            'log_line': json.dumps(log_entry),
-            'fields': log_entry
-        }
\ No newline at end of file
+        return LogEntry(
+            timestamp=ts,
+            log_line=_dumps(log_entry),
+            fields=log_entry
+        )
\ No newline at end of file
@@ -2,17 +2,27 @@
 
 import os
 import sys
+import errno
+import asyncio
+import queue
 import yaml
 import json
 import time
 import threading
 import logging
+from random import shuffle
+from itertools import cycle
 from datetime import datetime, time as dt_time
-from typing import Dict, Any, List
-from pathlib import Path
+from typing import Dict, Any, List, Iterator, FrozenSet
 import click
-from concurrent.futures import ThreadPoolExecutor
 import signal
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
 
 from log_generators import (
     NginxLogGenerator, JavaAppLogGenerator, KubernetesLogGenerator,
@@ -20,14 +30,230 @@ from log_generators import (
     DatabaseLogGenerator, DockerLogGenerator, CDNLogGenerator, CICDLogGenerator
 )
 
+# Most buffers the kernel accepts in a single writev call
+try:
+    IOV_MAX = os.sysconf('SC_IOV_MAX')
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = 1024
+
+# Log files are raw descriptors; every writev lands at the current end of file
+LOG_FILE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+
+# Durable log types are synced after each write (fdatasync is missing on macOS)
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+# Writers accumulate encoded lines and write once the buffer reaches this
+# size, or once this many seconds have passed since the last write
+WRITE_BUFFER_SIZE = 64 * 1024
+FLUSH_INTERVAL = 0.5
+
+# A buffer that a burst grew past this size is replaced by a fresh one after writing
+BUFFER_SHRINK_SIZE = 128 * 1024
+
+# Each generator produces roughly this many seconds' worth of entries per write
+BATCH_INTERVAL = 0.1
+
+# Length of the shuffled host sequence each log type cycles through
+HOST_CYCLE_LENGTH = 1024
+
+# How long a peak-hours check stays valid, in seconds
+PEAK_CHECK_TTL = 1.0
+
+# (epoch second, formatted string) of the last file timestamp produced
+_ts_cache = (None, '')
+
+def _cached_now_str() -> str:
+    global _ts_cache
+    now = int(time.time())
+    if _ts_cache[0] != now:
+        _ts_cache = (now, time.strftime('%Y%m%d_%H%M%S', time.localtime(now)))
+    return _ts_cache[1]
+
+def _writev_all(fd: int, buffers: List[bytes]) -> int:
+    written_total = 0
+    for start in range(0, len(buffers), IOV_MAX):
+        chunk = buffers[start:start + IOV_MAX]
+        expected = sum(map(len, chunk))
+        written = os.writev(fd, chunk)
+        written_total += written
+        
+        # Short writes are rare on regular files; resume from where it stopped
+        while written < expected:
+            expected -= written
+            while written >= len(chunk[0]):
+                written -= len(chunk.pop(0))
+            chunk[0] = chunk[0][written:]
+            written = os.writev(fd, chunk)
+            written_total += written
+    return written_total
+
+@dataclass(frozen=True)
+class RuntimeCfg:
+    """Config values read on the hot path, resolved once from the YAML config"""
+    # Declared by hand rather than with dataclass(slots=True), which needs Python 3.10
+    __slots__ = ('max_size_bytes', 'base_dir', 'peak_start', 'peak_end', 'peak_mult', 'rates', 'durable')
+    max_size_bytes: int
+    base_dir: str
+    peak_start: dt_time
+    peak_end: dt_time
+    peak_mult: float
+    rates: Dict[str, float]
+    durable: FrozenSet[str]
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'RuntimeCfg':
+        gen_config = config['log_generator']
+        peak_config = gen_config['business']['peak_hours']
+        return cls(
+            max_size_bytes=int(gen_config['output']['file_rotation']['max_size_mb'] * 1024 * 1024),
+            base_dir=gen_config['output']['base_directory'],
+            peak_start=dt_time.fromisoformat(peak_config['start']),
+            peak_end=dt_time.fromisoformat(peak_config['end']),
+            peak_mult=peak_config['multiplier'],
+            rates=dict(gen_config['rates']),
+            durable=frozenset(
+                log_type for log_type, enabled in gen_config['output'].get('durable', {}).items() if enabled
+            )
+        )
+
+class IoUringBatchEngine:
+    """Submits writes from every writer thread through one io_uring instance"""
+    
+    def __init__(self, max_batch: int = 64):
+        self.max_batch = max_batch
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(max_batch, self._ring)
+        self._pending = queue.SimpleQueue()
+        # Set once the ring fails; later writes go straight through os.writev
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="io-uring")
+        self._thread.start()
+    
+    def submit_write(self, fd: int, buffers: List[bytes]) -> int:
+        written_total = 0
+        for start in range(0, len(buffers), IOV_MAX):
+            chunk = buffers[start:start + IOV_MAX]
+            if self._error is not None:
+                written_total += _writev_all(fd, chunk)
+                continue
+            
+            op = [fd, chunk, threading.Event(), None]
+            self._pending.put(op)
+            op[2].wait()
+            
+            written = op[3]
+            if written is None:
+                # The ring failed before this write reached it
+                written_total += _writev_all(fd, chunk)
+                continue
+            if written < 0:
+                raise OSError(-written, os.strerror(-written))
+            written_total += written
+            
+            # Finish a short write synchronously
+            expected = sum(map(len, chunk))
+            if written < expected:
+                written_total += _writev_all(fd, [b''.join(chunk)[written:]])
+        return written_total
+    
+    def close(self):
+        self._pending.put(None)
+        self._thread.join()
+        liburing.io_uring_queue_exit(self._ring)
+    
+    def _run(self):
+        stopping = False
+        
+        while not stopping:
+            op = self._pending.get()
+            ops = []
+            while True:
+                if op is None:
+                    stopping = True
+                    break
+                ops.append(op)
+                if len(ops) == self.max_batch:
+                    break
+                try:
+                    op = self._pending.get_nowait()
+                except queue.Empty:
+                    break
+            if not ops:
+                continue
+            
+            if self._error is not None:
+                # Hand writes queued before the failure back to their writers
+                for op in ops:
+                    op[2].set()
+                continue
+            
+            try:
+                self._submit_batch(ops)
+            except Exception as e:
+                # These writes may have partly reached the kernel, so fail them
+                # rather than retry, and never use the ring again
+                self._error = e
+                code = getattr(e, 'errno', None) or errno.EIO
+                for op in ops:
+                    if not op[2].is_set():
+                        op[3] = -code
+                        op[2].set()
+    
+    def _submit_batch(self, ops: List[list]):
+        ring, cqe = self._ring, self._cqe
+        
+        # Queue every pending write, submit them together, then reap them all
+        iovecs = []
+        for index, (fd, chunk, _, _) in enumerate(ops):
+            iovec = liburing.Iovec(chunk)
+            iovecs.append(iovec)
+            sqe = liburing.io_uring_get_sqe(ring)
+            liburing.io_uring_prep_writev(sqe, fd, iovec)
+            liburing.io_uring_sqe_set_data64(sqe, index)
+        liburing.io_uring_submit(ring)
+        
+        for _ in ops:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            op = ops[liburing.io_uring_cqe_get_data64(entry)]
+            op[3] = entry.res
+            liburing.io_uring_cqe_seen(ring, entry)
+            op[2].set()
+
 class LogGeneratorOrchestrator:
     def __init__(self, config_path: str = "config.yaml"):
         self.config = self._load_config(config_path)
         self.generators = {}
         self.running = False
-        self.executor = None
+        self.stop_event = threading.Event()
         self.log_files = {}
         
+        # All generators run as tasks on one asyncio event loop in this thread
+        self._loop_thread = None
+        self._loop = None
+        self._generator_tasks = []
+        
+        # Generators only enqueue batches; one writer thread per type owns the file
+        self.write_queues: Dict[str, queue.SimpleQueue] = {}
+        self._writer_threads = []
+        
+        # Errors from the generator loop and writers are logged by one diagnostics thread
+        self._diag_q = queue.SimpleQueue()
+        self._diag_thread = None
+        
+        # Rotation swaps to a pre-opened file; opening and closing happen in the background
+        self._rotation_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rotation")
+        self._next_files: Dict[str, Future] = {}
+        
+        # Writes go through io_uring when liburing is installed, otherwise os.writev
+        self._io_engine = None
+        self._write_buffers = _writev_all
+        
+        # Settings are parsed once; the peak-hours check is reused for a second
+        self.cfg = RuntimeCfg.from_config(self.config)
+        self._peak_cached = (False, float('-inf'))
+        
         self._setup_logging()
         self._initialize_generators()
         self._create_output_directories()
@@ -65,117 +291,220 @@ class LogGeneratorOrchestrator:
             if log_type in self.config['log_generator']['rates']:
                 self.generators[log_type] = generator_class(self.config['log_generator'])
                 self.logger.info(f"Initialized {log_type} generator")
+        
+        # Hosts that run each service, falling back to the first host
+        hosts = self.config['log_generator']['infrastructure']['hosts']
+        self.hosts_by_type: Dict[str, List[Dict[str, Any]]] = {
+            log_type: [host for host in hosts if log_type in host['services']] or [hosts[0]]
+            for log_type in self.generators
+        }
+        
+        # Cycle through a shuffled sequence so picking a host needs no RNG call
+        self._host_cycles: Dict[str, Iterator[Dict[str, Any]]] = {}
+        for log_type, type_hosts in self.hosts_by_type.items():
+            sequence = type_hosts * max(1, HOST_CYCLE_LENGTH // len(type_hosts))
+            shuffle(sequence)
+            self._host_cycles[log_type] = cycle(sequence)
     
     def _create_output_directories(self):
-        base_dir = Path(self.config['log_generator']['output']['base_directory'])
-        base_dir.mkdir(exist_ok=True)
+        self._log_dirs: Dict[str, str] = {
+            log_type: os.path.join(self.cfg.base_dir, log_type) for log_type in self.generators
+        }
+        # Hidden, so collectors matching *.log skip files that are not in use yet
+        self._pending_paths: Dict[str, str] = {
+            log_type: os.path.join(log_dir, f".{log_type}.next") for log_type, log_dir in self._log_dirs.items()
+        }
         
-        for log_type in self.generators.keys():
-            log_dir = base_dir / log_type
-            log_dir.mkdir(exist_ok=True)
+        for log_type, log_dir in self._log_dirs.items():
+            os.makedirs(log_dir, exist_ok=True)
             
             # Create log file
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"{log_type}_{timestamp}.log"
-            file_path = log_dir / filename
+            timestamp = _cached_now_str()
+            file_path = f"{log_dir}/{log_type}_{timestamp}.log"
             
+            fd = os.open(file_path, LOG_FILE_FLAGS, 0o644)
             self.log_files[log_type] = {
                 'path': file_path,
-                'handle': open(file_path, 'a', encoding='utf-8'),
-                'size': 0
+                'fd': fd,
+                'size': os.fstat(fd).st_size  # appending to an existing file
             }
             
             self.logger.info(f"Created log file: {file_path}")
     
     def _is_peak_hours(self) -> bool:
+        is_peak, checked_at = self._peak_cached
+        current = time.monotonic()
+        if current - checked_at < PEAK_CHECK_TTL:
+            return is_peak
+        
         now = datetime.now().time()
-        peak_config = self.config['log_generator']['business']['peak_hours']
-        start_time = dt_time.fromisoformat(peak_config['start'])
-        end_time = dt_time.fromisoformat(peak_config['end'])
-        return start_time <= now <= end_time
+        is_peak = self.cfg.peak_start <= now <= self.cfg.peak_end
+        self._peak_cached = (is_peak, current)
+        return is_peak
     
     def _get_adjusted_rate(self, log_type: str) -> float:
-        base_rate = self.config['log_generator']['rates'][log_type]
+        base_rate = self.cfg.rates[log_type]
         if self._is_peak_hours():
-            multiplier = self.config['log_generator']['business']['peak_hours']['multiplier']
-            return base_rate * multiplier
+            return base_rate * self.cfg.peak_mult
         return base_rate
     
     def _get_host_for_service(self, log_type: str) -> Dict[str, Any]:
-        hosts = self.config['log_generator']['infrastructure']['hosts']
-        eligible_hosts = [host for host in hosts if log_type in host['services']]
-        
-        if not eligible_hosts:
-            # Fallback to first host
-            return hosts[0]
-        
-        import random
-        return random.choice(eligible_hosts)
+        return next(self._host_cycles[log_type])
     
-    def _write_log_entry(self, log_type: str, log_entry: Dict[str, Any]):
+    def _write_buffer(self, log_type: str, buf: memoryview):
         if log_type not in self.log_files:
             return
             
         file_info = self.log_files[log_type]
-        log_line = log_entry['log_line']
-        
-        # Write to file
-        file_info['handle'].write(log_line + '\n')
-        file_info['handle'].flush()
-        file_info['size'] += len(log_line) + 1
+        file_info['size'] += self._write_buffers(file_info['fd'], [buf])
+        if log_type in self.cfg.durable:
+            _fdatasync(file_info['fd'])
         
         # Check for rotation
-        max_size_bytes = self.config['log_generator']['output']['file_rotation']['max_size_mb'] * 1024 * 1024
-        if file_info['size'] > max_size_bytes:
+        if file_info['size'] > self.cfg.max_size_bytes:
             self._rotate_log_file(log_type)
     
+    def _open_pending_file(self, log_type: str) -> int:
+        return os.open(self._pending_paths[log_type], LOG_FILE_FLAGS | os.O_TRUNC, 0o644)
+    
     def _rotate_log_file(self, log_type: str):
-        file_info = self.log_files[log_type]
-        file_info['handle'].close()
+        old_fd = self.log_files[log_type]['fd']
         
-        # Create new file
-        base_dir = Path(self.config['log_generator']['output']['base_directory'])
-        log_dir = base_dir / log_type
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{log_type}_{timestamp}.log"
-        file_path = log_dir / filename
+        # Create new file; a rotation within the same second gets a numbered
+        # name, so every rotation starts a fresh, empty file
+        timestamp = _cached_now_str()
+        file_path = f"{self._log_dirs[log_type]}/{log_type}_{timestamp}.log"
+        suffix = 0
+        while os.path.exists(file_path):
+            suffix += 1
+            file_path = f"{self._log_dirs[log_type]}/{log_type}_{timestamp}_{suffix}.log"
+        
+        pending = self._next_files.pop(log_type, None)
+        if pending is not None:
+            # Take over the pre-opened file and give it its real name
+            fd = pending.result()
+            os.rename(self._pending_paths[log_type], file_path)
+            self._next_files[log_type] = self._rotation_executor.submit(self._open_pending_file, log_type)
+        else:
+            # Pre-opening failed last time; open this one directly
+            fd = os.open(file_path, LOG_FILE_FLAGS, 0o644)
+        size = 0
         
         self.log_files[log_type] = {
             'path': file_path,
-            'handle': open(file_path, 'a', encoding='utf-8'),
-            'size': 0
+            'fd': fd,
+            'size': size
         }
+        self._rotation_executor.submit(os.close, old_fd)
+        
+        self._diag_q.put_nowait((logging.INFO, f"Rotated log file: {file_path}"))
+    
+    def _writer_loop(self, log_type: str):
+        write_queue = self.write_queues[log_type]
+        # One preallocated buffer, filled up to pos and reused after every write
+        buf = bytearray(WRITE_BUFFER_SIZE)
+        view = memoryview(buf)
+        pos = 0
+        deadline = time.monotonic() + FLUSH_INTERVAL
+        done = False
         
-        self.logger.info(f"Rotated log file: {file_path}")
+        while not done:
+            try:
+                batch = write_queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                batch = []
+            
+            # Copy everything queued so far into the buffer
+            while True:
+                if batch is None:
+                    done = True
+                    break
+                if batch:
+                    data = '\n'.join(batch).encode()
+                    end = pos + len(data) + 1
+                    if end > len(buf):
+                        # Grow into a new buffer; resizing one with live views is not allowed
+                        grown = bytearray(max(end, 2 * len(buf)))
+                        grown[:pos] = view[:pos]
+                        buf, view = grown, memoryview(grown)
+                    view[pos:end - 1] = data
+                    view[end - 1] = 0x0a
+                    pos = end
+                try:
+                    batch = write_queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if done or pos >= WRITE_BUFFER_SIZE or time.monotonic() >= deadline:
+                try:
+                    if pos:
+                        self._write_buffer(log_type, view[:pos])
+                except Exception as e:
+                    self._diag_q.put_nowait((logging.ERROR, f"Error writing {log_type} logs: {e}"))
+                finally:
+                    pos = 0
+                    if len(buf) > BUFFER_SHRINK_SIZE:
+                        buf = bytearray(WRITE_BUFFER_SIZE)
+                        view = memoryview(buf)
+                deadline = time.monotonic() + FLUSH_INTERVAL
+    
+    def _diag_worker(self):
+        while True:
+            item = self._diag_q.get()
+            if item is None:
+                return
+            level, msg = item
+            self.logger.log(level, msg)
     
-    def _generate_logs_for_type(self, log_type: str):
+    async def _generate_logs_for_type(self, log_type: str):
         generator = self.generators[log_type]
+        write_queue = self.write_queues[log_type]
+        last_peak_state = None
         
         while self.running:
             try:
-                rate = self._get_adjusted_rate(log_type)
+                # The rate only changes when peak hours start or end
+                is_peak = self._is_peak_hours()
+                if is_peak != last_peak_state:
+                    rate = self._get_adjusted_rate(log_type)
+                    if rate > 0:
+                        batch_size = max(1, int(rate * BATCH_INTERVAL))
+                        sleep_time = batch_size / rate
+                    last_peak_state = is_peak
+                
                 if rate <= 0:
-                    time.sleep(1)
+                    await asyncio.sleep(1)
                     continue
                 
-                # Calculate sleep time between logs
-                sleep_time = 1.0 / rate if rate > 0 else 1.0
-                
-                # Get appropriate host for this service
-                host_info = self._get_host_for_service(log_type)
-                
-                # Generate log entry
-                log_entry = generator.generate_log(host_info)
+                # Generate the whole batch in one call, for an appropriate host
+                entries = generator.generate_batch(self._get_host_for_service(log_type), batch_size)
+                lines = [entry.log_line for entry in entries]
                 
-                # Write to file
-                self._write_log_entry(log_type, log_entry)
+                # Hand the whole batch to this type's writer thread
+                write_queue.put(lines)
                 
-                # Sleep until next log
-                time.sleep(sleep_time)
+                # Sleep until the next batch is due at this rate
+                await asyncio.sleep(sleep_time)
                 
             except Exception as e:
-                self.logger.error(f"Error generating {log_type} log: {e}")
-                time.sleep(1)
+                self._diag_q.put_nowait((logging.ERROR, f"Error generating {log_type} log: {e}"))
+                await asyncio.sleep(1)
+    
+    async def _main(self):
+        self._loop = asyncio.get_running_loop()
+        
+        # Start generator for each log type
+        for log_type in self.generators.keys():
+            self._generator_tasks.append(asyncio.create_task(self._generate_logs_for_type(log_type)))
+            self.logger.info(f"Started generator for {log_type}")
+        
+        self.logger.info("All generators started. Press Ctrl+C to stop.")
+        
+        await asyncio.gather(*self._generator_tasks, return_exceptions=True)
+    
+    def _cancel_generators(self):
+        for task in self._generator_tasks:
+            task.cancel()
     
     def start(self):
         if self.running:
@@ -183,25 +512,35 @@ class LogGeneratorOrchestrator:
             return
         
         self.running = True
+        self.stop_event.clear()
         self.logger.info("Starting log generation...")
         
-        # Start thread pool
-        max_workers = len(self.generators)
-        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Set up io_uring before any thread starts, so a failure here cannot
+        # leave start() with threads running and no stop() to end them
+        if liburing is not None:
+            try:
+                self._io_engine = IoUringBatchEngine()
+                self._write_buffers = self._io_engine.submit_write
+            except Exception as e:
+                self.logger.warning(f"io_uring unavailable, using writev: {e}")
+        
+        self._diag_thread = threading.Thread(target=self._diag_worker, name="diagnostics")
+        self._diag_thread.start()
         
-        # Start generator for each log type
-        futures = []
         for log_type in self.generators.keys():
-            future = self.executor.submit(self._generate_logs_for_type, log_type)
-            futures.append(future)
-            self.logger.info(f"Started generator for {log_type}")
+            self.write_queues[log_type] = queue.SimpleQueue()
+            self._next_files[log_type] = self._rotation_executor.submit(self._open_pending_file, log_type)
+            thread = threading.Thread(target=self._writer_loop, args=(log_type,), name=f"writer-{log_type}")
+            thread.start()
+            self._writer_threads.append(thread)
         
-        self.logger.info("All generators started. Press Ctrl+C to stop.")
+        # Run every generator on one event loop in a background thread
+        self._loop_thread = threading.Thread(target=asyncio.run, args=(self._main(),), name="log-generators")
+        self._loop_thread.start()
         
         try:
-            # Wait for interruption
-            while self.running:
-                time.sleep(1)
+            # Block until stop is requested; no periodic wakeups
+            self.stop_event.wait()
         except KeyboardInterrupt:
             self.logger.info("Received interrupt signal")
         finally:
@@ -213,13 +552,42 @@ class LogGeneratorOrchestrator:
         
         self.logger.info("Stopping log generation...")
         self.running = False
+        self.stop_event.set()
+        
+        if self._loop_thread:
+            # Wake generators out of their sleeps instead of waiting them out
+            if self._loop:
+                try:
+                    self._loop.call_soon_threadsafe(self._cancel_generators)
+                except RuntimeError:
+                    pass  # loop already finished
+            self._loop_thread.join()
+        
+        # Let each writer drain its queue, then wait for it to finish
+        for write_queue in self.write_queues.values():
+            write_queue.put(None)
+        for thread in self._writer_threads:
+            thread.join()
+        
+        if self._io_engine:
+            self._io_engine.close()
+        
+        # Finish background closes and discard the unused pre-opened files
+        self._rotation_executor.shutdown(wait=True)
+        for log_type, pending in self._next_files.items():
+            try:
+                os.close(pending.result())
+                os.unlink(self._pending_paths[log_type])
+            except OSError:
+                pass
         
-        if self.executor:
-            self.executor.shutdown(wait=True)
+        if self._diag_thread:
+            self._diag_q.put(None)
+            self._diag_thread.join()
         
         # Close all log files
         for log_type, file_info in self.log_files.items():
-            file_info['handle'].close()
+            os.close(file_info['fd'])
             self.logger.info(f"Closed log file for {log_type}")
         
         self.logger.info("Log generation stopped")
@@ -269,11 +637,10 @@ def main(config, status, duration):
         orchestrator.status()
         return
     
-    # Setup signal handler for graceful shutdown
+    # Setup signal handler for graceful shutdown; start() does the cleanup
     def signal_handler(signum, frame):
         click.echo("\nReceived shutdown signal...")
-        orchestrator.stop()
-        sys.exit(0)
+        orchestrator.stop_event.set()
     
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -288,10 +655,12 @@ def main(config, status, duration):
         generator_thread.daemon = True
         generator_thread.start()
         
-        # Wait for duration
-        time.sleep(duration)
-        orchestrator.stop()
-        click.echo(f"Stopped after {duration} seconds")
+        # Wait for duration, returning early on a shutdown signal
+        interrupted = orchestrator.stop_event.wait(duration)
+        orchestrator.stop_event.set()
+        generator_thread.join()
+        if not interrupted:
+            click.echo(f"Stopped after {duration} seconds")
     else:
         orchestrator.start()
 